@@ -196,6 +196,23 @@ def test_get_request(protocol_cls, event_loop):
         assert b"Hello, world" in protocol.transport.buffer
 
 
+@pytest.mark.parametrize("protocol_cls", HTTP_PROTOCOLS)
+def test_get_request_buffered(protocol_cls, event_loop):
+    app = Response("Hello, world", media_type="text/plain")
+
+    with get_connected_protocol(app, protocol_cls, event_loop) as protocol:
+        buffer = protocol.get_buffer(-1)
+        buffer[: len(SIMPLE_GET_REQUEST)] = SIMPLE_GET_REQUEST
+        protocol.buffer_updated(len(SIMPLE_GET_REQUEST))
+        assert protocol.read_buffer is None
+        assert list(protocol.server_state.buffer_pool) == [buffer]
+        assert protocol.get_buffer(-1) is buffer
+
+        protocol.loop.run_one()
+        assert b"HTTP/1.1 200 OK" in protocol.transport.buffer
+        assert b"Hello, world" in protocol.transport.buffer
+
+
 @pytest.mark.parametrize("path", ["/", "/?foo", "/?foo=bar", "/?foo=bar&baz=1"])
 @pytest.mark.parametrize("protocol_cls", HTTP_PROTOCOLS)
 def test_request_logging(path, protocol_cls, caplog, event_loop):
@@ -311,6 +328,24 @@ def test_chunked_encoding_empty_body(protocol_cls, event_loop):
         assert not protocol.transport.is_closing()
 
 
+@pytest.mark.parametrize("protocol_cls", HTTP_PROTOCOLS)
+def test_chunked_encoding_streaming(protocol_cls, event_loop):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in [b"a", b"", b"bb"]:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"ccc"})
+
+    with get_connected_protocol(app, protocol_cls, event_loop) as protocol:
+        protocol.data_received(SIMPLE_GET_REQUEST)
+        protocol.loop.run_one()
+        assert b"HTTP/1.1 200 OK" in protocol.transport.buffer
+        assert protocol.transport.buffer.endswith(
+            b"\r\n\r\n1\r\na\r\n2\r\nbb\r\n3\r\nccc\r\n0\r\n\r\n"
+        )
+        assert not protocol.transport.is_closing()
+
+
 @pytest.mark.parametrize("protocol_cls", HTTP_PROTOCOLS)
 def test_chunked_encoding_head_request(protocol_cls, event_loop):
     app = Response(
@@ -20,7 +20,12 @@ from pytest_mock import MockerFixture
 
 from tests.utils import as_cwd
 from uvicorn._types import Environ, StartResponse
-from uvicorn.config import LOGGING_CONFIG, Config
+from uvicorn.config import (
+    LOGGING_CONFIG,
+    REUSEPORT_LOAD_BALANCING,
+    Config,
+    _ssl_context_cache,
+)
 from uvicorn.middleware.debug import DebugMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from uvicorn.middleware.wsgi import WSGIMiddleware
@@ -308,6 +313,19 @@ def test_socket_bind() -> None:
     sock.close()
 
 
+@pytest.mark.skipif(
+    not REUSEPORT_LOAD_BALANCING, reason="requires SO_REUSEPORT load balancing"
+)
+@pytest.mark.parametrize("workers, expected", [(1, False), (2, True)])
+def test_socket_bind_reuseport(workers: int, expected: bool) -> None:
+    config = Config(app=asgi_app, workers=workers)
+    config.load()
+    sock = config.bind_socket()
+    reuseport = sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+    assert bool(reuseport) is expected
+    sock.close()
+
+
 def test_ssl_config(
     tls_ca_certificate_pem_path: str,
     tls_ca_certificate_private_key_path: str,
@@ -332,6 +350,60 @@ def test_ssl_config_combined(tls_certificate_key_and_chain_path: str) -> None:
     assert config.is_ssl is True
 
 
+def test_ssl_context_is_reused(tls_certificate_key_and_chain_path: str) -> None:
+    first = Config(app=asgi_app, ssl_certfile=tls_certificate_key_and_chain_path)
+    first.load()
+    second = Config(app=asgi_app, ssl_certfile=tls_certificate_key_and_chain_path)
+    second.load()
+
+    assert first.ssl is not None
+    assert first.ssl is second.ssl
+
+
+def test_ssl_context_reloaded_on_change(
+    tls_certificate_key_and_chain_path: str,
+) -> None:
+    first = Config(app=asgi_app, ssl_certfile=tls_certificate_key_and_chain_path)
+    first.load()
+
+    stat = os.stat(tls_certificate_key_and_chain_path)
+    os.utime(
+        tls_certificate_key_and_chain_path,
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+    )
+    second = Config(app=asgi_app, ssl_certfile=tls_certificate_key_and_chain_path)
+    second.load()
+
+    assert first.ssl is not second.ssl
+
+
+def test_ssl_context_cache_keeps_no_password(
+    tls_certificate_private_key_encrypted_path: str,
+    tls_certificate_server_cert_path: str,
+) -> None:
+    password = "uvicorn password for the win"
+    config = Config(
+        app=asgi_app,
+        ssl_keyfile=tls_certificate_private_key_encrypted_path,
+        ssl_certfile=tls_certificate_server_cert_path,
+        ssl_keyfile_password=password,
+    )
+    config.load()
+
+    assert config.ssl is not None
+    assert all(password not in key for key in _ssl_context_cache)
+
+    _ssl_context_cache.clear()
+    other = Config(
+        app=asgi_app,
+        ssl_keyfile=tls_certificate_private_key_encrypted_path,
+        ssl_certfile=tls_certificate_server_cert_path,
+        ssl_keyfile_password=password,
+    )
+    other.load()
+    assert other.ssl is not config.ssl
+
+
 def asgi2_app(scope: Scope) -> typing.Callable:
     async def asgi(
         receive: ASGIReceiveCallable, send: ASGISendCallable
@@ -1,8 +1,11 @@
+from email.utils import formatdate
+
 import httpx
 import pytest
 
 from tests.utils import run_server
 from uvicorn import Config
+from uvicorn.server import format_date_header
 
 
 async def app(scope, receive, send):
@@ -97,3 +100,23 @@ async def test_disable_default_date_header():
         async with httpx.AsyncClient() as client:
             response = await client.get("http://127.0.0.1:8000")
             assert "date" not in response.headers
+
+
+@pytest.mark.parametrize("timestamp", [0, 784111777, 1640995199.999, 1709164800])
+def test_format_date_header(timestamp):
+    expected = formatdate(timestamp, usegmt=True).encode()
+    assert format_date_header(timestamp) == expected
+
+
+@pytest.mark.asyncio
+async def test_date_header_updated_in_place():
+    config = Config(app=app, loop="asyncio", limit_max_requests=1)
+    async with run_server(config) as server:
+        default_headers = server.server_state.default_headers
+        assert default_headers[0][0] == b"date"
+        default_headers[0] = (b"date", b"stale")
+
+        server.on_tick()
+        assert server.server_state.default_headers is default_headers
+        assert default_headers[0] != (b"date", b"stale")
+        assert default_headers[1:] == config.encoded_headers
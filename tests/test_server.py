@@ -0,0 +1,208 @@
+import asyncio
+import signal
+import threading
+
+import httpx
+import pytest
+
+from tests.utils import run_server, start_server
+from uvicorn.config import REUSEPORT_LOAD_BALANCING, Config
+from uvicorn.server import Server, WaitableSet
+
+
+@pytest.mark.asyncio
+async def test_waitable_set_wait_empty():
+    items = WaitableSet()
+    items.add(1)
+    items.add(2)
+
+    waiter = asyncio.ensure_future(items.wait_empty())
+    await asyncio.sleep(0)
+    items.discard(1)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    items.remove(2)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_waitable_set_wake_waiters():
+    items = WaitableSet()
+    items.add(1)
+
+    waiter = asyncio.ensure_future(items.wait_empty())
+    await asyncio.sleep(0)
+    items.wake_waiters()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert items == {1}
+
+
+@pytest.mark.asyncio
+async def test_waitable_set_already_empty():
+    await asyncio.wait_for(WaitableSet().wait_empty(), timeout=1)
+
+
+async def app(scope, receive, send):
+    assert scope["type"] == "http"
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_protocol", ["h11", "httptools"])
+async def test_limit_max_requests_exits(http_protocol):
+    config = Config(app=app, loop="asyncio", http=http_protocol, limit_max_requests=1)
+    server = Server(config=config)
+    serve_task = await start_server(server)
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get("http://127.0.0.1:8000")
+    assert response.status_code == 204
+
+    await asyncio.wait_for(serve_task, timeout=2)
+    # A signal received while draining should still shut down gracefully.
+    assert not server.should_exit
+
+
+@pytest.mark.asyncio
+async def test_should_exit_from_another_thread():
+    config = Config(app=app, loop="asyncio")
+    server = Server(config=config)
+    serve_task = await start_server(server)
+
+    thread = threading.Thread(target=setattr, args=(server, "should_exit", True))
+    thread.start()
+    thread.join()
+
+    await asyncio.wait_for(serve_task, timeout=2)
+
+
+def test_force_exit_after_run_returns():
+    config = Config(app=app, loop="asyncio")
+    server = Server(config=config)
+    thread = threading.Thread(target=server.run)
+    thread.start()
+    assert server.started_event.wait(5)
+
+    server.should_exit = True
+    thread.join(5)
+    assert not thread.is_alive()
+
+    server.force_exit = True
+    server.handle_exit(signal.SIGINT, None)
+
+
+@pytest.mark.asyncio
+async def test_handle_exit_wakes_main_loop():
+    config = Config(app=app, loop="asyncio")
+    server = Server(config=config)
+    serve_task = await start_server(server)
+
+    server.handle_exit(signal.SIGINT, None)
+    assert server._exit_waiter.done()
+
+    await asyncio.wait_for(serve_task, timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_force_exit_ends_shutdown():
+    request_received = asyncio.Event()
+
+    async def stuck_app(scope, receive, send):
+        request_received.set()
+        await asyncio.Event().wait()
+
+    config = Config(app=stuck_app, loop="asyncio", lifespan="off")
+    server = Server(config=config)
+    serve_task = await start_server(server)
+
+    async with httpx.AsyncClient() as client:
+        request = asyncio.ensure_future(client.get("http://127.0.0.1:8000"))
+        await asyncio.wait_for(request_received.wait(), timeout=2)
+
+        server.should_exit = True
+        await asyncio.sleep(0.3)
+        assert not serve_task.done()
+
+        server.force_exit = True
+        await asyncio.wait_for(serve_task, timeout=0.5)
+        request.cancel()
+
+
+@pytest.mark.asyncio
+async def test_callback_notify(monkeypatch):
+    # Run the loop's clock ahead of the real one, so that the test can tell
+    # which clock was used, and fast forward it past `timeout_notify`.
+    loop = asyncio.get_event_loop()
+    loop_time = loop.time
+    offset = 1000.0
+    monkeypatch.setattr(loop, "time", lambda: loop_time() + offset)
+
+    notified = []
+    notified_event = asyncio.Event()
+
+    async def callback_notify():
+        notified.append(loop.time())
+        notified_event.set()
+
+    config = Config(
+        app=app, loop="asyncio", callback_notify=callback_notify, timeout_notify=30
+    )
+    async with run_server(config) as server:
+        await asyncio.wait_for(notified_event.wait(), timeout=1)
+        notified_event.clear()
+        assert server.last_notified <= notified[0] < server.last_notified + 1
+
+        await asyncio.sleep(0.2)
+        assert len(notified) == 1
+
+        offset += 30
+        await asyncio.wait_for(notified_event.wait(), timeout=1)
+        assert server.last_notified - notified[0] >= 30
+
+
+@pytest.mark.asyncio
+async def test_callback_notify_at_most_once_per_second():
+    calls = 0
+
+    async def callback_notify():
+        nonlocal calls
+        calls += 1
+
+    config = Config(
+        app=app, loop="asyncio", callback_notify=callback_notify, timeout_notify=0
+    )
+    async with run_server(config):
+        await asyncio.sleep(1.5)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_callback_notify_error_stops_server():
+    async def callback_notify():
+        raise RuntimeError("notify failed")
+
+    config = Config(app=app, loop="asyncio", callback_notify=callback_notify)
+    server = Server(config=config)
+    serve_task = await start_server(server)
+
+    with pytest.raises(RuntimeError, match="notify failed"):
+        await asyncio.wait_for(serve_task, timeout=2)
+    await server.shutdown()
+
+
+@pytest.mark.skipif(
+    not REUSEPORT_LOAD_BALANCING, reason="requires SO_REUSEPORT load balancing"
+)
+@pytest.mark.asyncio
+async def test_workers_listen_on_own_reuseport_socket():
+    config = Config(app=app, loop="asyncio", workers=2, limit_max_requests=1)
+    sock = config.bind_socket()
+    async with run_server(config, sockets=[sock]) as server:
+        (listener,) = server.servers[0].sockets
+        assert listener.fileno() != sock.fileno()
+        assert listener.getsockname() == sock.getsockname()
+        async with httpx.AsyncClient() as client:
+            response = await client.get("http://127.0.0.1:8000")
+    assert response.status_code == 204
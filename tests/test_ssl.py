@@ -1,3 +1,7 @@
+import asyncio
+import socket
+import ssl
+
 import httpx
 import pytest
 
@@ -83,3 +87,94 @@ async def test_run_password(
         async with httpx.AsyncClient(verify=tls_ca_ssl_context) as client:
             response = await client.get("https://127.0.0.1:8000")
     assert response.status_code == 204
+
+
+async def echo_app(scope, receive, send):
+    assert scope["type"] == "http"
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    headers = [(b"content-length", str(len(body)).encode())]
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+def tls_request(ssl_context, records):
+    """
+    Send each of `records` as its own TLS record, all in a single TCP write,
+    and return the raw response once the server closes the connection.
+    """
+    sock = socket.create_connection(("127.0.0.1", 8000), timeout=5)
+    incoming, outgoing = ssl.MemoryBIO(), ssl.MemoryBIO()
+    tls = ssl_context.wrap_bio(incoming, outgoing, server_hostname="127.0.0.1")
+    try:
+        while True:
+            try:
+                tls.do_handshake()
+                break
+            except ssl.SSLWantReadError:
+                sock.sendall(outgoing.read())
+                incoming.write(sock.recv(65536))
+        sock.sendall(outgoing.read())
+
+        payload = b""
+        for record in records:
+            tls.write(record)
+            payload += outgoing.read()
+        sock.sendall(payload)
+
+        response = b""
+        while True:
+            try:
+                chunk = tls.read(65536)
+            except ssl.SSLWantReadError:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                incoming.write(data)
+                continue
+            except ssl.SSLZeroReturnError:
+                break
+            if not chunk:
+                break
+            response += chunk
+        return response
+    finally:
+        sock.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_protocol", ["h11", "httptools"])
+async def test_run_multiple_records_per_read(
+    http_protocol,
+    tls_ca_ssl_context,
+    tls_certificate_server_cert_path,
+    tls_certificate_private_key_path,
+):
+    config = Config(
+        app=echo_app,
+        loop="asyncio",
+        http=http_protocol,
+        ssl_keyfile=tls_certificate_private_key_path,
+        ssl_certfile=tls_certificate_server_cert_path,
+    )
+    loop = asyncio.get_event_loop()
+    async with run_server(config):
+        headers = b"POST / HTTP/1.1\r\nHost: example.org\r\nConnection: close\r\n"
+        first = b"S" * 200
+        request = headers + b"Content-Length: 200\r\n\r\n"
+        await loop.run_in_executor(
+            None, tls_request, tls_ca_ssl_context, [request + first]
+        )
+
+        # The headers and the body arrive as two TLS records in one TCP segment.
+        second = b"B" * 100
+        request = headers + b"Content-Length: 100\r\n\r\n"
+        response = await loop.run_in_executor(
+            None, tls_request, tls_ca_ssl_context, [request, second]
+        )
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert response.endswith(b"\r\n\r\n" + second)
@@ -11,11 +11,23 @@ except ImportError:  # pragma: no cover
 from uvicorn import Config, Server
 
 
+async def start_server(server: Server, sockets=None, timeout=5.0):
+    """Start serving in the background, and wait until the server has started."""
+    serve_task = asyncio.ensure_future(server.serve(sockets=sockets))
+    # Don't leave the waiting thread blocked if `serve()` returns without starting.
+    serve_task.add_done_callback(lambda task: server.started_event.set())
+    loop = asyncio.get_event_loop()
+    started = await loop.run_in_executor(None, server.started_event.wait, timeout)
+    if not started and not serve_task.done():
+        serve_task.cancel()
+        raise asyncio.TimeoutError(f"Server did not start within {timeout} seconds")
+    return serve_task
+
+
 @asynccontextmanager
 async def run_server(config: Config, sockets=None):
     server = Server(config=config)
-    cancel_handle = asyncio.ensure_future(server.serve(sockets=sockets))
-    await asyncio.sleep(0.1)
+    cancel_handle = await start_server(server, sockets=sockets)
     try:
         yield server
     finally:
@@ -1,4 +1,6 @@
 import asyncio
+import hashlib
+import hmac
 import inspect
 import json
 import logging
@@ -7,6 +9,7 @@ import os
 import socket
 import ssl
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
@@ -76,6 +79,12 @@ INTERFACES: List[InterfaceType] = ["auto", "asgi3", "asgi2", "wsgi"]
 
 SSL_PROTOCOL_VERSION: int = ssl.PROTOCOL_TLS_SERVER
 
+# Only Linux (3.9+) spreads incoming connections across SO_REUSEPORT sockets.
+# Elsewhere the option exists, but one worker may end up with all the traffic.
+REUSEPORT_LOAD_BALANCING: bool = sys.platform.startswith("linux") and hasattr(
+    socket, "SO_REUSEPORT"
+)
+
 
 LOGGING_CONFIG: dict = {
     "version": 1,
@@ -133,6 +142,67 @@ def create_ssl_context(
     return ctx
 
 
+def _get_mtime(path: Optional[Union[str, os.PathLike]]) -> Optional[int]:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Keyed on the SSL settings and the files' mtimes, so that certificates which
+# are replaced on disk get loaded again. Call `.clear()` to drop the contexts.
+_ssl_context_cache: "OrderedDict[tuple, ssl.SSLContext]" = OrderedDict()
+_SSL_CONTEXT_CACHE_SIZE = 32
+# Key passwords are only ever part of the cache key as a keyed hash.
+_SSL_PASSWORD_KEY = os.urandom(32)
+
+
+def _create_cached_ssl_context(
+    certfile: str,
+    keyfile: Optional[Union[str, os.PathLike]],
+    password: Optional[str],
+    ssl_version: int,
+    cert_reqs: int,
+    ca_certs: Optional[Union[str, os.PathLike]],
+    ciphers: Optional[str],
+) -> ssl.SSLContext:
+    password_hash = (
+        hmac.new(_SSL_PASSWORD_KEY, password.encode(), hashlib.sha256).digest()
+        if password
+        else None
+    )
+    mtimes = tuple(_get_mtime(path) for path in (certfile, keyfile, ca_certs))
+    key = (
+        certfile,
+        keyfile,
+        password_hash,
+        ssl_version,
+        cert_reqs,
+        ca_certs,
+        ciphers,
+        mtimes,
+    )
+    ctx = _ssl_context_cache.get(key)
+    if ctx is None:
+        ctx = create_ssl_context(
+            certfile=certfile,
+            keyfile=keyfile,
+            password=password,
+            ssl_version=ssl_version,
+            cert_reqs=cert_reqs,
+            ca_certs=ca_certs,
+            ciphers=ciphers,
+        )
+        _ssl_context_cache[key] = ctx
+        if len(_ssl_context_cache) > _SSL_CONTEXT_CACHE_SIZE:
+            _ssl_context_cache.popitem(last=False)
+    else:
+        _ssl_context_cache.move_to_end(key)
+    return ctx
+
+
 def is_dir(path: Path) -> bool:
     try:
         if not path.is_absolute():
@@ -408,9 +478,12 @@ class Config:
 
         if self.is_ssl:
             assert self.ssl_certfile
-            self.ssl: Optional[ssl.SSLContext] = create_ssl_context(
+            # Loading certificates is expensive, so reuse the context across
+            # configs that point at the same, unchanged, files. Note that this
+            # means `self.ssl` may be shared with other configs.
+            self.ssl: Optional[ssl.SSLContext] = _create_cached_ssl_context(
                 keyfile=self.ssl_keyfile,
-                certfile=self.ssl_certfile,
+                certfile=str(self.ssl_certfile),
                 password=self.ssl_keyfile_password,
                 ssl_version=self.ssl_version,
                 cert_reqs=self.ssl_cert_reqs,
@@ -537,6 +610,10 @@ class Config:
 
             sock = socket.socket(family=family)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if self.workers > 1 and REUSEPORT_LOAD_BALANCING:
+                # Allow each worker to listen on a socket of its own.
+                # See `Server.startup()`.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             try:
                 sock.bind((self.host, self.port))
             except OSError as exc:
@@ -1,7 +1,20 @@
-def auto_loop_setup() -> None:
+import platform
+import sys
+
+
+def _uvloop_available() -> bool:
+    if sys.platform == "win32" or platform.python_implementation() == "PyPy":
+        # uvloop is not available on Windows, and not supported on PyPy.
+        return False  # pragma: no cover
     try:
         import uvloop  # noqa
     except ImportError:  # pragma: no cover
+        return False
+    return True
+
+
+def auto_loop_setup() -> None:
+    if not _uvloop_available():  # pragma: no cover
         from uvicorn.loops.asyncio import asyncio_setup as loop_setup
 
         loop_setup()
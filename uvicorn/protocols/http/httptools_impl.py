@@ -15,6 +15,8 @@ from uvicorn.protocols.http.flow_control import (
     service_unavailable,
 )
 from uvicorn.protocols.utils import (
+    READ_BUFFER_SIZE,
+    BufferedProtocol,
     get_client_addr,
     get_local_addr,
     get_path_with_query_string,
@@ -39,7 +41,7 @@ STATUS_LINE = {
 }
 
 
-class HttpToolsProtocol(asyncio.Protocol):
+class HttpToolsProtocol(asyncio.Protocol, BufferedProtocol):
     def __init__(
         self, config, server_state, on_connection_lost: Callable = None, _loop=None
     ):
@@ -57,6 +59,7 @@ class HttpToolsProtocol(asyncio.Protocol):
         self.ws_protocol_class = config.ws_protocol_class
         self.root_path = config.root_path
         self.limit_concurrency = config.limit_concurrency
+        self.limit_max_requests = config.limit_max_requests
 
         # Timeouts
         self.timeout_keep_alive_task = None
@@ -70,6 +73,7 @@ class HttpToolsProtocol(asyncio.Protocol):
 
         # Per-connection state
         self.transport = None
+        self.read_buffer = None
         self.flow = None
         self.server = None
         self.client = None
@@ -99,6 +103,9 @@ class HttpToolsProtocol(asyncio.Protocol):
 
     def connection_lost(self, exc):
         self.connections.discard(self)
+        if self.read_buffer is not None:
+            self.server_state.buffer_pool.append(self.read_buffer)
+            self.read_buffer = None
 
         if self.logger.level <= TRACE_LOG_LEVEL:
             prefix = "%s:%d - " % tuple(self.client) if self.client else ""
@@ -124,6 +131,25 @@ class HttpToolsProtocol(asyncio.Protocol):
             self.timeout_keep_alive_task.cancel()
             self.timeout_keep_alive_task = None
 
+    def get_buffer(self, sizehint):
+        # Hand out a memoryview, so that slices of it taken by the transport
+        # are written to in place, rather than to a copy.
+        if self.read_buffer is None:
+            pool = self.server_state.buffer_pool
+            self.read_buffer = (
+                pool.pop() if pool else memoryview(bytearray(READ_BUFFER_SIZE))
+            )
+        return self.read_buffer
+
+    def buffer_updated(self, nbytes):
+        # The parser copies whatever it keeps, so once it returns the buffer
+        # can go back to the pool. Idle connections don't hold on to a buffer.
+        read_buffer, self.read_buffer = self.read_buffer, None
+        try:
+            self.data_received(read_buffer[:nbytes])
+        finally:
+            self.server_state.buffer_pool.append(read_buffer)
+
     def data_received(self, data):
         self._unset_keepalive_if_required()
 
@@ -278,6 +304,11 @@ class HttpToolsProtocol(asyncio.Protocol):
     def on_response_complete(self):
         # Callback for pipelined HTTP requests to be started.
         self.server_state.total_requests += 1
+        if (
+            self.server_state.total_requests == self.limit_max_requests
+            and self.server_state.on_max_requests is not None
+        ):
+            self.server_state.on_max_requests()
 
         if self.transport.is_closing():
             return
@@ -491,13 +522,14 @@ class RequestResponseCycle:
             if self.scope["method"] == "HEAD":
                 self.expected_content_length = 0
             elif self.chunked_encoding:
-                if body:
-                    content = [b"%x\r\n" % len(body), body, b"\r\n"]
-                else:
-                    content = []
-                if not more_body:
-                    content.append(b"0\r\n\r\n")
-                self.transport.write(b"".join(content))
+                # Frame each chunk with a single bytes formatting operation, as
+                # streaming responses can send a large number of small chunks.
+                if body and more_body:
+                    self.transport.write(b"%x\r\n%b\r\n" % (len(body), body))
+                elif body:
+                    self.transport.write(b"%x\r\n%b\r\n0\r\n\r\n" % (len(body), body))
+                elif not more_body:
+                    self.transport.write(b"0\r\n\r\n")
             else:
                 num_bytes = len(body)
                 if num_bytes > self.expected_content_length:
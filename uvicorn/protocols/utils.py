@@ -1,9 +1,20 @@
 import asyncio
+import sys
 import urllib.parse
 from typing import Optional, Tuple
 
 from asgiref.typing import WWWScope
 
+if sys.version_info >= (3, 7):
+    BufferedProtocol = asyncio.BufferedProtocol
+else:  # pragma: no cover
+    # Transports fall back to calling `data_received()` on plain protocols.
+    BufferedProtocol = asyncio.BaseProtocol
+
+# Size of the pooled buffers that the transport reads incoming data into. This
+# matches the read size asyncio transports use for plain protocols.
+READ_BUFFER_SIZE = 256 * 1024
+
 
 def get_remote_addr(transport: asyncio.Transport) -> Optional[Tuple[str, int]]:
     socket_info = transport.get_extra_info("socket")
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import logging
 import os
 import platform
@@ -7,14 +8,24 @@ import socket
 import sys
 import threading
 import time
-from email.utils import formatdate
 from types import FrameType
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import click
 
 from uvicorn._handlers.http import handle_http
-from uvicorn.config import Config
+from uvicorn.config import REUSEPORT_LOAD_BALANCING, Config
 
 if TYPE_CHECKING:
     from uvicorn.protocols.http.h11_impl import H11Protocol
@@ -36,9 +47,103 @@ HANDLED_SIGNALS = (
     signal.SIGINT,  # Unix signal 2. Sent by Ctrl+C.
     signal.SIGTERM,  # Unix signal 15. Sent by `kill <pid>`.
 )
+if sys.platform == "win32":  # pragma: no cover
+    HANDLED_SIGNALS += (signal.SIGBREAK,)  # Windows signal 21. Sent by Ctrl+Break.
 
 logger = logging.getLogger("uvicorn.error")
 
+_STARTED_MESSAGE = "Started server process [%d]"
+_STARTED_COLOR_MESSAGE = "Started server process [" + click.style("%d", fg="cyan") + "]"
+_FINISHED_MESSAGE = "Finished server process [%d]"
+_FINISHED_COLOR_MESSAGE = (
+    "Finished server process [" + click.style("%d", fg="cyan") + "]"
+)
+
+_DAY_NAMES = (b"Mon", b"Tue", b"Wed", b"Thu", b"Fri", b"Sat", b"Sun")
+_MONTH_NAMES = (
+    b"Jan",
+    b"Feb",
+    b"Mar",
+    b"Apr",
+    b"May",
+    b"Jun",
+    b"Jul",
+    b"Aug",
+    b"Sep",
+    b"Oct",
+    b"Nov",
+    b"Dec",
+)
+
+_cached_date_sec = -1
+_cached_date_bytes = b""
+
+
+def format_date_header(current_time: float) -> bytes:
+    """
+    Return `current_time` formatted as an RFC 7231 HTTP-date, eg.
+    b"Sun, 06 Nov 1994 08:49:37 GMT". The result is cached per second.
+    """
+    global _cached_date_sec, _cached_date_bytes
+
+    sec = int(current_time)
+    if sec != _cached_date_sec:
+        tm = time.gmtime(sec)
+        _cached_date_bytes = b"%s, %02d %s %04d %02d:%02d:%02d GMT" % (
+            _DAY_NAMES[tm.tm_wday],
+            tm.tm_mday,
+            _MONTH_NAMES[tm.tm_mon - 1],
+            tm.tm_year,
+            tm.tm_hour,
+            tm.tm_min,
+            tm.tm_sec,
+        )
+        _cached_date_sec = sec
+    return _cached_date_bytes
+
+
+_T = TypeVar("_T")
+
+
+class WaitableSet(Set[_T]):
+    """
+    A set that lets a coroutine wait until it becomes empty, instead of polling.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._waiters: List[asyncio.Future] = []
+
+    def remove(self, item: _T) -> None:
+        super().remove(item)
+        if not self:
+            self.wake_waiters()
+
+    def discard(self, item: object) -> None:
+        super().discard(item)
+        if not self:
+            self.wake_waiters()
+
+    def wake_waiters(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_empty(self) -> None:
+        """
+        Wait until the set is empty, or until `wake_waiters()` is called.
+        """
+        if not self:
+            return
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
 
 class ServerState:
     """
@@ -47,29 +152,115 @@ class ServerState:
 
     def __init__(self) -> None:
         self.total_requests = 0
-        self.connections: Set["Protocols"] = set()
-        self.tasks: Set[asyncio.Task] = set()
+        # Protocols hash by identity, so adding and removing connections and tasks
+        # is already O(1) without any per-protocol bookkeeping.
+        self.connections: WaitableSet["Protocols"] = WaitableSet()
+        self.tasks: WaitableSet[asyncio.Task] = WaitableSet()
         self.default_headers: List[Tuple[bytes, bytes]] = []
+        # Read buffers shared by the HTTP protocols. A connection only holds one
+        # while the transport reads into it, so a handful is plenty.
+        self.buffer_pool: Deque[memoryview] = collections.deque(maxlen=8)
+        # Called by the HTTP protocols once `limit_max_requests` has been reached.
+        self.on_max_requests: Optional[Callable[[], None]] = None
 
 
 class Server:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.server_state = ServerState()
+        self.server_state.on_max_requests = self._on_max_requests
 
         self.started = False
-        self.should_exit = False
-        self.force_exit = False
-        self.last_notified = 0.0
+        # Lets other threads wait for startup, rather than polling `started`.
+        self.started_event = threading.Event()
+        self._should_exit = False
+        self._force_exit = False
+        self.last_notified = float("-inf")
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exit_waiter: Optional[asyncio.Future] = None
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        self._notify_task: Optional[asyncio.Task] = None
+
+    @property
+    def should_exit(self) -> bool:
+        return self._should_exit
+
+    @should_exit.setter
+    def should_exit(self, value: bool) -> None:
+        self._should_exit = value
+        if value and self._exit_waiter is not None:
+            self._call_on_loop(self._wake_main_loop)
+
+    @property
+    def force_exit(self) -> bool:
+        return self._force_exit
+
+    @force_exit.setter
+    def force_exit(self, value: bool) -> None:
+        self._force_exit = value
+        if value:
+            # Unblock `shutdown()` if it is waiting on connections or tasks.
+            self._call_on_loop(self._wake_shutdown)
+
+    def _call_on_loop(self, callback: Callable[[], None]) -> None:
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            # Not serving, or done serving, so there's nothing to wake up.
+            return
+        running_loop: Optional[asyncio.AbstractEventLoop] = None
+        if sys.version_info >= (3, 7):
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        else:  # pragma: no cover
+            # There is no public way to do this on Python 3.6.
+            running_loop = asyncio._get_running_loop()
+        if running_loop is loop:
+            # Set from a loop callback, eg. a signal handler or a protocol.
+            callback()
+        else:
+            # Set from another thread, so wake up the loop thread-safely.
+            try:
+                loop.call_soon_threadsafe(callback)
+            except RuntimeError:
+                # The loop was closed in the meantime.
+                pass
+
+    def _wake_main_loop(self) -> None:
+        waiter = self._exit_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _wake_shutdown(self) -> None:
+        self.server_state.connections.wake_waiters()
+        self.server_state.tasks.wake_waiters()
+
+    def _on_max_requests(self) -> None:
+        # Stop the main loop without setting `should_exit`, so that a signal
+        # received while draining still shuts down gracefully.
+        self._call_on_loop(self._wake_main_loop)
+
+    def _max_requests_reached(self) -> bool:
+        return (
+            self.config.limit_max_requests is not None
+            and self.server_state.total_requests >= self.config.limit_max_requests
+        )
 
     def run(self, sockets: Optional[List[socket.socket]] = None) -> None:
         self.config.setup_event_loop()
         if sys.version_info >= (3, 7):
+            # `asyncio.run()` creates a fresh loop from the policy installed by
+            # `setup_event_loop()`, ie. a uvloop loop when it is in use.
             return asyncio.run(self.serve(sockets=sockets))
-        return asyncio.get_event_loop().run_until_complete(self.serve(sockets=sockets))
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(self.serve(sockets=sockets))
 
     async def serve(self, sockets: Optional[List[socket.socket]] = None) -> None:
         process_id = os.getpid()
+        self.loop = asyncio.get_event_loop()
 
         config = self.config
         if not config.loaded:
@@ -79,9 +270,11 @@ class Server:
 
         self.install_signal_handlers()
 
-        message = "Started server process [%d]"
-        color_message = "Started server process [" + click.style("%d", fg="cyan") + "]"
-        logger.info(message, process_id, extra={"color_message": color_message})
+        logger.info(
+            _STARTED_MESSAGE,
+            process_id,
+            extra={"color_message": _STARTED_COLOR_MESSAGE},
+        )
 
         await self.startup(sockets=sockets)
         if self.should_exit:
@@ -89,9 +282,11 @@ class Server:
         await self.main_loop()
         await self.shutdown(sockets=sockets)
 
-        message = "Finished server process [%d]"
-        color_message = "Finished server process [" + click.style("%d", fg="cyan") + "]"
-        logger.info(message, process_id, extra={"color_message": color_message})
+        logger.info(
+            _FINISHED_MESSAGE,
+            process_id,
+            extra={"color_message": _FINISHED_COLOR_MESSAGE},
+        )
 
     async def startup(self, sockets: list = None) -> None:
         await self.lifespan.startup()
@@ -100,13 +295,19 @@ class Server:
             return
 
         config = self.config
+        # The default headers are built once. Protocols hold on to this list, and
+        # `on_tick()` refreshes the date header in place.
+        default_headers = list(config.encoded_headers)
+        if config.date_header:
+            default_headers.insert(0, (b"date", format_date_header(time.time())))
+        self.server_state.default_headers = default_headers
+
+        server_state = self.server_state
 
         async def handler(
             reader: asyncio.StreamReader, writer: asyncio.StreamWriter
         ) -> None:
-            await handle_http(
-                reader, writer, server_state=self.server_state, config=config
-            )
+            await handle_http(reader, writer, server_state, config)
 
         if sockets is not None:
             # Explicitly passed a list of open sockets.
@@ -120,10 +321,29 @@ class Server:
                 sock_data = sock.share(os.getpid())  # type: ignore
                 return fromshare(sock_data)
 
+            def _uses_reuseport(sock: socket.SocketType) -> bool:
+                return (
+                    REUSEPORT_LOAD_BALANCING
+                    and sock.family in (socket.AF_INET, socket.AF_INET6)
+                    and bool(sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT))
+                )
+
+            def _reuseport_socket(sock: socket.SocketType) -> socket.SocketType:
+                # Bind a socket of our own to the same address, so that the kernel
+                # load balances incoming connections across the workers, rather
+                # than waking every worker up on a single shared accept queue.
+                new_sock = socket.socket(sock.family, socket.SOCK_STREAM)
+                new_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                new_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                new_sock.bind(sock.getsockname())
+                return new_sock
+
             self.servers = []
             for sock in sockets:
                 if config.workers > 1 and platform.system() == "Windows":
                     sock = _share_socket(sock)
+                elif config.workers > 1 and _uses_reuseport(sock):
+                    sock = _reuseport_socket(sock)
                 server = await asyncio.start_server(
                     handler, sock=sock, ssl=config.ssl, backlog=config.backlog
                 )
@@ -180,6 +400,7 @@ class Server:
             pass
 
         self.started = True
+        self.started_event.set()
 
     def _log_started_message(self, listeners: List[socket.SocketType]) -> None:
         config = self.config
@@ -223,41 +444,54 @@ class Server:
             )
 
     async def main_loop(self) -> None:
-        counter = 0
-        should_exit = await self.on_tick(counter)
-        while not should_exit:
-            counter += 1
-            counter = counter % 864000
-            await asyncio.sleep(0.1)
-            should_exit = await self.on_tick(counter)
-
-    async def on_tick(self, counter: int) -> bool:
-        # Update the default headers, once per second.
-        if counter % 10 == 0:
-            current_time = time.time()
-            current_date = formatdate(current_time, usegmt=True).encode()
-
-            if self.config.date_header:
-                date_header = [(b"date", current_date)]
-            else:
-                date_header = []
-
-            self.server_state.default_headers = (
-                date_header + self.config.encoded_headers
-            )
-
-            # Callback to `callback_notify` once every `timeout_notify` seconds.
-            if self.config.callback_notify is not None:
-                if current_time - self.last_notified > self.config.timeout_notify:
-                    self.last_notified = current_time
-                    await self.config.callback_notify()
-
-        # Determine if we should exit.
-        if self.should_exit:
-            return True
-        if self.config.limit_max_requests is not None:
-            return self.server_state.total_requests >= self.config.limit_max_requests
-        return False
+        assert self.loop is not None
+        self._exit_waiter = self.loop.create_future()
+        waiters = [self._exit_waiter]
+        if self.config.callback_notify is not None:
+            self._notify_task = asyncio.ensure_future(self._notify())
+            waiters.append(self._notify_task)
+        self.on_tick()
+        try:
+            if not self.should_exit and not self._max_requests_reached():
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._exit_waiter = None
+            if self._tick_handle is not None:
+                self._tick_handle.cancel()
+                self._tick_handle = None
+            notify_task, self._notify_task = self._notify_task, None
+            if notify_task is not None and not notify_task.done():
+                notify_task.cancel()
+
+        if notify_task is not None and notify_task.done():
+            # Propagate any error raised by `callback_notify`.
+            notify_task.result()
+
+    async def _notify(self) -> None:
+        # Callback to `callback_notify` once every `timeout_notify` seconds, but
+        # at most once per second, eg. with Gunicorn's `--timeout 0`.
+        # Use the loop's monotonic clock, so wall clock adjustments don't matter.
+        assert self.loop is not None
+        assert self.config.callback_notify is not None
+        interval = max(self.config.timeout_notify, 1.0)
+        while True:
+            self.last_notified = self.loop.time()
+            await self.config.callback_notify()
+            await asyncio.sleep(interval)
+
+    def on_tick(self) -> None:
+        assert self.loop is not None
+
+        # Update the date header, once per second.
+        if self.config.date_header:
+            current_date = format_date_header(time.time())
+            self.server_state.default_headers[0] = (b"date", current_date)
+
+        # Cancel any pending tick, in case we were called directly rather than
+        # from the timer, so that there is only ever one tick scheduled.
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+        self._tick_handle = self.loop.call_later(1.0, self.on_tick)
 
     async def shutdown(self, sockets: Optional[List[socket.socket]] = None) -> None:
         logger.info("Shutting down")
@@ -267,11 +501,11 @@ class Server:
             server.close()
         for sock in sockets or []:
             sock.close()
-        for server in self.servers:
-            await server.wait_closed()
+        await asyncio.gather(*[server.wait_closed() for server in self.servers])
 
-        # Request shutdown on all existing connections.
-        for connection in list(self.server_state.connections):
+        # Request shutdown on all existing connections. Iterate over a snapshot,
+        # since connections remove themselves from the set as they close.
+        for connection in tuple(self.server_state.connections):
             connection.shutdown()
         await asyncio.sleep(0.1)
 
@@ -280,33 +514,47 @@ class Server:
             msg = "Waiting for connections to close. (CTRL+C to force quit)"
             logger.info(msg)
             while self.server_state.connections and not self.force_exit:
-                await asyncio.sleep(0.1)
+                await self._wait_empty(self.server_state.connections)
 
         # Wait for existing tasks to complete.
         if self.server_state.tasks and not self.force_exit:
             msg = "Waiting for background tasks to complete. (CTRL+C to force quit)"
             logger.info(msg)
             while self.server_state.tasks and not self.force_exit:
-                await asyncio.sleep(0.1)
+                await self._wait_empty(self.server_state.tasks)
 
         # Send the lifespan shutdown event, and wait for application shutdown.
         if not self.force_exit:
             await self.lifespan.shutdown()
 
+    async def _wait_empty(self, waitable: WaitableSet) -> None:
+        # Wake up at least once a second regardless. Some event loops, such as
+        # the Windows selector loop, only run signal handlers between events.
+        try:
+            await asyncio.wait_for(waitable.wait_empty(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+
     def install_signal_handlers(self) -> None:
         if threading.current_thread() is not threading.main_thread():
             # Signals can only be listened to from the main thread.
             return
 
-        loop = asyncio.get_event_loop()
+        assert self.loop is not None
 
         try:
             for sig in HANDLED_SIGNALS:
-                loop.add_signal_handler(sig, self.handle_exit, sig, None)
+                self.loop.add_signal_handler(sig, self.handle_exit, sig, None)
         except NotImplementedError:  # pragma: no cover
-            # Windows
+            # Windows. Hand the signal over to the loop, so that `handle_exit()`
+            # always runs as a loop callback, and the loop gets woken up.
+            loop = self.loop
+
+            def handle_signal(sig: signal.Signals, frame: FrameType) -> None:
+                loop.call_soon_threadsafe(self.handle_exit, sig, frame)
+
             for sig in HANDLED_SIGNALS:
-                signal.signal(sig, self.handle_exit)
+                signal.signal(sig, handle_signal)
 
     def handle_exit(self, sig: signal.Signals, frame: FrameType) -> None:
 